@@ -1,75 +1,138 @@
-import FreeCADGui
-
-from .sphericallens import SphericalLensMenu
-FreeCADGui.addCommand('SphericalLens',SphericalLensMenu())
-
-from .cylindricallens import CylindricalLensMenu
-FreeCADGui.addCommand('CylindricalLens',CylindricalLensMenu())
-
-from .roundmirror import RoundMirrorMenu
-FreeCADGui.addCommand('RoundMirror',RoundMirrorMenu())
-
-from .rectmirror import RectMirrorMenu
-FreeCADGui.addCommand('RectangularMirror',RectMirrorMenu())
-
-from .rayspoint import RaysPointMenu
-FreeCADGui.addCommand('RaysPoint',RaysPointMenu())
-
-from .raysparallel import RaysParallelMenu
-FreeCADGui.addCommand('RaysParallel',RaysParallelMenu())
-
-from .raysarray import RaysArrayMenu
-FreeCADGui.addCommand('RaysArray',RaysArrayMenu())
-
-from .ray import RayMenu
-FreeCADGui.addCommand('Ray',RayMenu())
-
-from .propagate import PropagateMenu
-FreeCADGui.addCommand('Propagate',PropagateMenu())
-FreeCADGui.addCommand('btnPropagate',PropagateMenu())
-
-from .catalogcomponent import CatalogComponentMenu
-FreeCADGui.addCommand('CatalogComponent',CatalogComponentMenu())
-
-from .sensor import SensorMenu
-FreeCADGui.addCommand('Sensor',SensorMenu())
+import importlib
 
-from .reports import ReportsMenu
-FreeCADGui.addCommand('Reports',ReportsMenu())
-
-from .doubletlens import DoubletLensMenu
-FreeCADGui.addCommand('DoubletLens',DoubletLensMenu())
-
-from .optimize import OptimizeMenu
-FreeCADGui.addCommand('Optimize',OptimizeMenu())
-
-from .thicklens import ThickLensMenu
-FreeCADGui.addCommand('ThickLens',ThickLensMenu())
-
-from .diffractiongratting import DiffractionGrattingMenu
-FreeCADGui.addCommand('DiffractionGratting',DiffractionGrattingMenu())
-
-from .aperture import ApertureMenu
-FreeCADGui.addCommand('Aperture',ApertureMenu())
-
-from .pentaprism import PentaPrismMenu
-FreeCADGui.addCommand('PentaPrism',PentaPrismMenu())
-
-from .doveprism import DovePrismMenu
-FreeCADGui.addCommand('DovePrism',DovePrismMenu())
-
-from .rightangleprism import RightAnglePrismMenu
-FreeCADGui.addCommand('RightAnglePrism', RightAnglePrismMenu())
-
-
-from .bscube import BSCubeMenu
-FreeCADGui.addCommand('BSCube',BSCubeMenu())
-
-from .powelllens import PowellLensMenu
-FreeCADGui.addCommand('PowellLens',PowellLensMenu())
+import FreeCAD
+import FreeCADGui
 
-from .lensdata import LensDataMenu
-FreeCADGui.addCommand('LensData', LensDataMenu())
 
-from .utils import wipe
-FreeCADGui.addCommand('btnWipe', wipe.WipeMenu())
+class _LazyMenu:
+    """Command that only imports its implementation when it is used.
+
+    Importing the command modules pulls pyoptools (and with it numpy, scipy
+    and the material catalogs), so the workbench registers this thin
+    wrapper instead, and the real menu class is imported and instanced the
+    first time the command is activated.
+
+    The menu text and tool tip of every command are only defined here, the
+    menu classes in the command modules do not implement GetResources.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module, relative to this package, that defines the menu.
+    class_name : str
+        Name of the menu class inside the module.
+    menu_text : str
+        Text shown in the menu.
+    tool_tip : str
+        Tool tip of the command.
+    """
+
+    def __init__(self, module_name, class_name, menu_text, tool_tip):
+        self._module_name = module_name
+        self._class_name = class_name
+        self._resources = {"MenuText": menu_text, "ToolTip": tool_tip, "Pixmap": ""}
+        self._impl = None
+
+    def _load(self):
+        if self._impl is None:
+            module = importlib.import_module(self._module_name, __name__)
+            self._impl = getattr(module, self._class_name)()
+        return self._impl
+
+    def GetResources(self):
+        return self._resources
+
+    def IsActive(self):
+        # FreeCAD polls this all the time, so do not import anything here.
+        if self._impl is not None:
+            return self._impl.IsActive()
+        return FreeCAD.ActiveDocument is not None
+
+    def Activated(self):
+        self._load().Activated()
+
+
+def _addCommand(name, module_name, class_name, menu_text, tool_tip):
+    FreeCADGui.addCommand(
+        name, _LazyMenu(module_name, class_name, menu_text, tool_tip)
+    )
+
+
+_addCommand(
+    "SphericalLens", ".sphericallens", "SphericalLensMenu",
+    "Spherical Lens", "Add Spherical Lens",
+)
+_addCommand(
+    "CylindricalLens", ".cylindricallens", "CylindricalLensMenu",
+    "Cylindrical Lens", "Add Cylindrical Lens",
+)
+_addCommand(
+    "RoundMirror", ".roundmirror", "RoundMirrorMenu",
+    "Round Mirror", "Add Round Mirror",
+)
+_addCommand(
+    "RectangularMirror", ".rectmirror", "RectMirrorMenu",
+    "Rectangular Mirror", "Add Rectangular Mirror",
+)
+_addCommand(
+    "RaysPoint", ".rayspoint", "RaysPointMenu",
+    "Add Point Source", "Add Point Source",
+)
+_addCommand(
+    "RaysParallel", ".raysparallel", "RaysParallelMenu",
+    "Add Parallel Ray Source", "Add Parallel Ray Source",
+)
+_addCommand(
+    "RaysArray", ".raysarray", "RaysArrayMenu",
+    "Add Array of Sources", "Add Array of Sources",
+)
+_addCommand("Ray", ".ray", "RayMenu", "Add Ray Source", "Add Ray Source")
+_addCommand(
+    "Propagate", ".propagate", "PropagateMenu", "Propagate", "Propagate Rays"
+)
+_addCommand(
+    "btnPropagate", ".propagate", "PropagateMenu", "Propagate", "Propagate Rays"
+)
+_addCommand(
+    "CatalogComponent", ".catalogcomponent", "CatalogComponentMenu",
+    "Catalog Component", "Catalog Component",
+)
+_addCommand("Sensor", ".sensor", "SensorMenu", "Sensor", "Add Sensor")
+_addCommand("Reports", ".reports", "ReportsMenu", "Reports", "Generate reports")
+_addCommand(
+    "DoubletLens", ".doubletlens", "DoubletLensMenu",
+    "Doublet Lens", "Add Doublet Lens",
+)
+_addCommand("Optimize", ".optimize", "OptimizeMenu", "Optimize", "Optimize System")
+_addCommand(
+    "ThickLens", ".thicklens", "ThickLensMenu", "Thick Lens", "Add Ideal Thick Lens"
+)
+_addCommand(
+    "DiffractionGratting", ".diffractiongratting", "DiffractionGrattingMenu",
+    "Diffraction Gratting", "Add Diffraction Gratting",
+)
+_addCommand("Aperture", ".aperture", "ApertureMenu", "Aperture", "Add Aperture")
+_addCommand(
+    "PentaPrism", ".pentaprism", "PentaPrismMenu", "Penta Prism", "Add Penta Prism"
+)
+_addCommand(
+    "DovePrism", ".doveprism", "DovePrismMenu", "Dove Prism", "Add Dove Prism"
+)
+_addCommand(
+    "RightAnglePrism", ".rightangleprism", "RightAnglePrismMenu",
+    "Right Angle Prism", "Add Right Angle Prism",
+)
+_addCommand(
+    "BSCube", ".bscube", "BSCubeMenu",
+    "Beam Splitting Cube", "Add Beam Splitting Cube",
+)
+_addCommand(
+    "PowellLens", ".powelllens", "PowellLensMenu", "Powell Lens", "Add Powell Lens"
+)
+_addCommand(
+    "LensData", ".lensdata", "LensDataMenu",
+    "LensData", "Add Lenses from data editor",
+)
+_addCommand(
+    "btnWipe", ".utils.wipe", "WipeMenu", "Wipe", "Delete propagations and rays"
+)
@@ -2,6 +2,7 @@
 """Classes used to define an aperture."""
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import makePlacement
 import FreeCAD
 import FreeCADGui
 import Part
@@ -10,8 +11,6 @@ from FreeCAD import Units
 import pyoptools.raytrace.comp_lib as comp_lib
 from pyoptools.raytrace.shape import Circular
 
-from math import radians
-
 
 class ApertureGUI(WBCommandGUI):
     def __init__(self):
@@ -31,13 +30,7 @@ class ApertureGUI(WBCommandGUI):
         Zrot = self.form.Zrot.value()
 
         obj = InsertApp(inDiam, outDiam, ID="AP")
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -45,14 +38,6 @@ class ApertureMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, ApertureGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Aperture",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Aperture",
-            "Pixmap": "",
-        }
-
 
 class AperturePart(WBPart):
     def __init__(self, obj, InD=10, OutD=50):
@@ -6,11 +6,10 @@ import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
 from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
-from math import radians
 
 
 class BSCubeGUI(WBCommandGUI):
@@ -36,13 +35,7 @@ class BSCubeGUI(WBCommandGUI):
             matref = self.form.Reference.currentText()
 
         obj = InsertBSC(S, Ref, ID="BS1", matcat=matcat, matref=matref)
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -50,14 +43,6 @@ class BSCubeMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, BSCubeGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Beam Splitting Cube",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Beam Splitting Cube",
-            "Pixmap": "",
-        }
-
 
 class BSCubePart(WBPart):
     def __init__(self, obj, S=50, Ref=100, matcat="", matref=""):
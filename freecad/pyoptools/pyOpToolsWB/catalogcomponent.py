@@ -4,14 +4,26 @@ import FreeCAD
 import FreeCADGui
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getComponentCatalogs, makePlacement
 from PySide import QtGui
 from pyoptools.raytrace.library import library
 from pyoptools.raytrace.mat_lib import material
 from .sphericallens import InsertSL
 from .doubletlens import InsertDL
 from .cylindricallens import InsertCL
-from math import radians
 from ast import literal_eval
+from functools import lru_cache
+
+
+# The same materials (N-BK7, ...) are used by hundreds of catalog parts, so
+# the lookups are cached at module level and shared between dialogs.
+@lru_cache(maxsize=None)
+def _is_material_available(reference):
+    try:
+        material[reference]
+    except KeyError:
+        return False
+    return True
 
 
 class CatalogComponentGUI(WBCommandGUI):
@@ -19,15 +31,23 @@ class CatalogComponentGUI(WBCommandGUI):
         pw = placementWidget()
         WBCommandGUI.__init__(self, [pw, "CatalogComponent.ui"])
 
-        for catalog in library.catalogs():
-            c = getattr(library, catalog)
-            self.form.Catalog.addItem(catalog, sorted(c.parts()))
-
-        # Dictionary to cache the material availability
-        self.__material_available_cache__={}
+        # Fill the catalog list in one batch, with signals and repaints
+        # disabled, as it is done in the material widget.
+        catalogs = getComponentCatalogs()
+        combo = self.form.Catalog
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        combo.addItems([catalog for catalog, _ in catalogs])
+        for n, (_, parts) in enumerate(catalogs):
+            combo.setItemData(n, list(parts))
+        combo.setUpdatesEnabled(True)
+        combo.blockSignals(False)
+
+        # Dictionary to cache the component availability, keyed by
+        # (catalog, reference)
+        self.__component_available_cache__ = {}
 
         self.catalogChange(0)
-        self.referenceChange(0)
 
         self.form.Catalog.currentIndexChanged.connect(self.catalogChange)
         self.form.Reference.currentIndexChanged.connect(self.referenceChange)
@@ -36,13 +56,24 @@ class CatalogComponentGUI(WBCommandGUI):
 
     def catalogChange(self, *args):
 
-        self.form.Reference.clear()
-        self.form.Reference.addItems(self.form.Catalog.itemData(args[0]))
+        # Rebuild the reference list without signals, so referenceChange is
+        # called once for the new catalog, not for each intermediate state.
+        reference = self.form.Reference
+        reference.blockSignals(True)
+        reference.setUpdatesEnabled(False)
+        reference.clear()
+        reference.addItems(self.form.Catalog.itemData(args[0]))
+        reference.setUpdatesEnabled(True)
+        reference.blockSignals(False)
+
+        self.referenceChange(reference.currentIndex())
 
         # Colocar los cuadros verdes y rojos para marcar si una componente está
         # disponible, se demora demasiado. Se comenta para no perder la idea
         # pero hay que hacerla diferente
         
+        # If this is enabled again, the pixmaps must be created only once
+        # (in __init__), not on each catalog change.
         #red = QtGui.QPixmap(16, 16)
         #red.fill(QtGui.QColor("red"))
         #green = QtGui.QPixmap(16, 16)
@@ -56,23 +87,16 @@ class CatalogComponentGUI(WBCommandGUI):
         #    self.form.Reference.addItem(color, reference)
             # item.setStyleSheet("color: green")
 
-    def is_material_available(self,reference):
-        if reference in self.__material_available_cache__:
-            rv =  self.__material_available_cache__[reference]
-        else:
-            try:
-                mat = material[reference]
-                self.__material_available_cache__[reference] = True;
-                rv=True
-            except KeyError:
-                self.__material_available_cache__[reference] = False;
-                rv=False
-
-        return rv
-        
+    def is_material_available(self, reference):
+        return _is_material_available(reference)
+
     def is_available(self, catalog, reference):
         # catalog = self.form.Catalog.currentText()
         # reference = self.form.Reference.currentText()
+        key = (catalog, reference)
+        if key in self.__component_available_cache__:
+            return self.__component_available_cache__[key]
+
         part_descriptor = getattr(library, catalog).descriptor(reference)
         ok = True
         comp_type = part_descriptor["type"]
@@ -103,6 +127,7 @@ class CatalogComponentGUI(WBCommandGUI):
             print("Component Type {} not found".format(comp_type))
             ok = False
 
+        self.__component_available_cache__[key] = ok
         return ok
 
     def referenceChange(self, *args):
@@ -168,7 +193,7 @@ class CatalogComponentGUI(WBCommandGUI):
                     raise ValueError("Trying to use a wrong glass catalog"
                                      f" {matcat} not in {glass_catalogs}")
                                      
-                obj = InsertSL(c1, c2, th, diam, "L", matcat, mat)
+                obj = InsertSL(c1, c2, th, diam, "L", matcat, mat, recompute=False)
 
             if comptype == "CylindricalLens":
                 mat = part_descriptor["material"]
@@ -261,14 +286,9 @@ class CatalogComponentGUI(WBCommandGUI):
                 )
 
             if obj is not None:
-                m = FreeCAD.Matrix()
-                m.rotateX(radians(Xrot))
-                m.rotateY(radians(Yrot))
-                m.rotateZ(radians(Zrot))
-                m.move((X, Y, Z))
-                p1 = FreeCAD.Placement(m)
-                obj.Placement = p1
+                obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
                 obj.Reference = "{} - {}".format(catalog, reference)
+                FreeCAD.ActiveDocument.recompute()
 
             FreeCADGui.Control.closeDialog()
 
@@ -276,11 +296,3 @@ class CatalogComponentGUI(WBCommandGUI):
 class CatalogComponentMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, CatalogComponentGUI)
-
-    def GetResources(self):
-        return {
-            "MenuText": "Catalog Component",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Catalog Component",
-            "Pixmap": "",
-        }
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """Classes used to define a cylindrical lens."""
+from functools import lru_cache
+
 import FreeCAD
 import FreeCADGui
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
@@ -10,8 +12,7 @@ from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
 import Part
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
-from math import radians
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 class CylindricalLensGUI(WBCommandGUI):
     def __init__(self):
@@ -40,13 +41,7 @@ class CylindricalLensGUI(WBCommandGUI):
         obj = InsertCL(
             CS1, CS2, CT, W, H, ID="L", matcat=matcat, matref=matref
         )
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -54,14 +49,6 @@ class CylindricalLensMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, CylindricalLensGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Cylindrical Lens",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Cylindrical Lens",
-            "Pixmap": "",
-        }
-
 
 class CylindricalLensPart(WBPart):
     def __init__(
@@ -160,43 +147,57 @@ def InsertCL(
 
 
 def buildcylens(CS1, CS2, W, H, CT):
+    """Return the shape of a cylindrical lens.
+
+    Lenses with the same parameters are common (catalog parts, copies), and
+    the Boolean operations are the slow part of the build, so the shapes
+    are cached by their (rounded) parameters. A copy is returned so the
+    cached shape is never shared.
+    """
+    key = tuple(round(float(v), 9) for v in (CS1, CS2, W, H, CT))
+    return _buildcylens(*key).copy()
+
 
-    d = Part.makeBox(H, W, CT + H)
-    d.translate(FreeCAD.Base.Vector(-H / 2.0, -W / 2, -(CT + H) / 2))
+@lru_cache(maxsize=64)
+def _buildcylens(CS1, CS2, W, H, CT):
+    # A flat surface is made by trimming the box, only the curved surfaces
+    # need a Boolean operation with a cylinder.
+    zmin = -CT / 2 if CS1 == 0 else -(CT + H) / 2
+    zmax = CT / 2 if CS2 == 0 else (CT + H) / 2
 
-    if CS1 == 0:
-        R1 = 1e6
-    else:
+    t = Part.makeBox(H, W, zmax - zmin)
+    t.translate(FreeCAD.Base.Vector(-H / 2.0, -W / 2, zmin))
+
+    if CS1 != 0:
         R1 = 1.0 / CS1
 
-    f1 = Part.makeCylinder(
-        abs(R1),
-        W,
-        FreeCAD.Base.Vector(0, -W / 2, 0),
-        FreeCAD.Base.Vector(0, 1, 0),
-    )
-    f1.translate(FreeCAD.Base.Vector(0, 0, R1 - CT / 2))
+        f1 = Part.makeCylinder(
+            abs(R1),
+            W,
+            FreeCAD.Base.Vector(0, -W / 2, 0),
+            FreeCAD.Base.Vector(0, 1, 0),
+        )
+        f1.translate(FreeCAD.Base.Vector(0, 0, R1 - CT / 2))
 
-    if CS2 == 0:
-        R2 = 1e6
-    else:
+        if R1 > 0:
+            t = t.common(f1)
+        else:
+            t = t.cut(f1)
+
+    if CS2 != 0:
         R2 = 1.0 / CS2
 
-    f2 = Part.makeCylinder(
-        abs(R2),
-        W,
-        FreeCAD.Base.Vector(0, -W / 2, 0),
-        FreeCAD.Base.Vector(0, 1, 0),
-    )
-    f2.translate(FreeCAD.Base.Vector(0, 0, R2 + CT / 2))
-
-    if R1 > 0:
-        t = d.common(f1)
-    else:
-        t = d.cut(f1)
-    if R2 > 0:
-        t = t.cut(f2)
-    else:
-        t = t.common(f2)
+        f2 = Part.makeCylinder(
+            abs(R2),
+            W,
+            FreeCAD.Base.Vector(0, -W / 2, 0),
+            FreeCAD.Base.Vector(0, 1, 0),
+        )
+        f2.translate(FreeCAD.Base.Vector(0, 0, R2 + CT / 2))
+
+        if R2 > 0:
+            t = t.cut(f2)
+        else:
+            t = t.common(f2)
 
     return t
@@ -10,8 +10,7 @@ from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
 
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
-from math import radians
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 class DiffractionGrattingGUI(WBCommandGUI):
     def __init__(self):
@@ -57,13 +56,7 @@ class DiffractionGrattingGUI(WBCommandGUI):
         obj = InsertDiffG(
             Ref, Th, SX, SY, Ang, GP, M, ID="G1", matcat=matcat, matref=matref
         )
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -71,12 +64,6 @@ class DiffractionGrattingMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, DiffractionGrattingGUI)
 
-    def GetResources(self):
-        return {"MenuText": "Diffraction Gratting",
-                #"Accel": "Ctrl+M",
-                "ToolTip": "Add Diffraction Gratting",
-                "Pixmap": ""}
-
 class DiffractionGrattingPart(WBPart):
     def __init__(
         self,
@@ -166,7 +153,6 @@ class DiffractionGrattingPart(WBPart):
             ),
         )
         obj.Shape = d
-        print(obj.M)
 
 
 def InsertDiffG(
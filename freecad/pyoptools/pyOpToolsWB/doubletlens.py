@@ -10,8 +10,7 @@ from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
 from .sphericallens import buildlens
-from math import radians
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 class DoubletLensGUI(WBCommandGUI):
     def __init__(self):
@@ -90,13 +89,7 @@ class DoubletLensGUI(WBCommandGUI):
             matref2,
         )
 
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
 
         FreeCADGui.Control.closeDialog()
 
@@ -105,14 +98,6 @@ class DoubletLensMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, DoubletLensGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Doublet Lens",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Doublet Lens",
-            "Pixmap": "",
-        }
-
 
 class DoubletLensPart(WBPart):
     def __init__(
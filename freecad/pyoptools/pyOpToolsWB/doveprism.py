@@ -8,8 +8,7 @@ from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidge
 from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
-from math import radians
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 class DovePrismGUI(WBCommandGUI):
     def __init__(self):
@@ -34,13 +33,7 @@ class DovePrismGUI(WBCommandGUI):
             matref = self.form.Reference.currentText()
 
         obj = InsertDP(S, L, ID="DP1", matcat=matcat, matref=matref)
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -48,14 +41,6 @@ class DovePrismMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, DovePrismGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Dove Prism",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Dove Prism",
-            "Pixmap": "",
-        }
-
 
 class DovePrismPart(WBPart):
     def __init__(self, obj, S=20, L=50, matcat="", matref=""):
@@ -4,6 +4,7 @@ import FreeCAD
 import FreeCADGui
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import makePlacement
 
 import Part
 
@@ -11,7 +12,6 @@ import pyoptools.raytrace.comp_lib as comp_lib
 from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
 
 import pyoptools.raytrace.mat_lib as matlib
-from math import radians
 from freecad.pyoptools import ICONPATH
 from PySide2 import QtWidgets
 from PySide2.QtCore import QLocale
@@ -118,13 +118,7 @@ class LensDataGUI(WBCommandGUI):
         datalist = (surfType, radius, thick, semid, matcat, matref)
 
         obj = InsertLD(datalist, ID="L")
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -132,14 +126,6 @@ class LensDataMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, LensDataGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "LensData",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Lenses from data editor",
-            "Pixmap": "",
-        }
-
 
 class LensDataPart(WBPart):
     def __init__(self, obj, datalist):
@@ -236,12 +222,9 @@ class LensDataPart(WBPart):
                 lenses.append(L)
             p = p + th0
 
-        L = lenses[0]
-
-        for l in lenses[1:]:
-            L = L.fuse(l)
-
-        obj.Shape = L
+        # The lenses are only drawn, so a compound is enough. Fusing them
+        # one by one got slower with each lens added.
+        obj.Shape = Part.makeCompound(lenses)
 
     def pyoptools_repr(self, obj):
         Type = obj.Type
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 """Simple optimization of optical systems."""
 
-from .wbcommand import *
+import FreeCADGui
+from .wbcommand import WBCommandGUI, WBCommandMenu
 import FreeCAD
 from .pyoptoolshelpers import getActiveSystem
 from numpy import std, array, sqrt
@@ -193,11 +194,3 @@ def opt_y(d, el="", sen="", ax="Z"):
 class OptimizeMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, OptimizeGUI)
-
-    def GetResources(self):
-        return {
-            "MenuText": "Optimize",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Optimize System",
-            "Pixmap": "",
-        }
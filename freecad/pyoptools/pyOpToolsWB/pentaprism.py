@@ -6,7 +6,7 @@ import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
 from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
@@ -35,13 +35,7 @@ class PentaPrismGUI(WBCommandGUI):
             matref = self.form.Reference.currentText()
 
         obj = InsertPP(S, ID="PP1", matcat=matcat, matref=matref)
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -49,14 +43,6 @@ class PentaPrismMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, PentaPrismGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Penta Prism",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Penta Prism",
-            "Pixmap": "",
-        }
-
 
 class PentaPrismPart(WBPart):
     def __init__(self, obj, S=50, matcat="", matref=""):
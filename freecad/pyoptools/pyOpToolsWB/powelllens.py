@@ -7,13 +7,12 @@ from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import (
     placementWidget,
 )
 from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 import Part
 
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
-from math import radians
 from math import sqrt
 
 
@@ -42,13 +41,7 @@ class PowellLensGUI(WBCommandGUI):
             matref = self.form.Reference.currentText()
 
         obj = InsertSL(R, CT, K, D, ID="PL", matcat=matcat, matref=matref)
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -56,14 +49,6 @@ class PowellLensMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, PowellLensGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Powell Lens",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Powell Lens",
-            "Pixmap": "",
-        }
-
 
 class PowellLensPart(WBPart):
     def __init__(
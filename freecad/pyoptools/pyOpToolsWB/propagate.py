@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 import FreeCAD, Part
 
+from collections import defaultdict
 from math import radians
-from .wbcommand import *
-from .pyoptoolshelpers import getActiveSystem
+from .wbcommand import WBPart
+from .pyoptoolshelpers import getActiveSystem, wavelengthToRGB
 
 from pyoptools.raytrace.system import System
 
-from pyoptools.misc.pmisc.misc import wavelength2RGB
 from pyoptools.raytrace.calc import parallel_propagate
 
 
@@ -17,14 +17,6 @@ class PropagateMenu:
         # WBCommandMenu.__init__(self,None)
         pass
 
-    def GetResources(self):
-        return {
-            "MenuText": "Propagate",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Propagate Rays",
-            "Pixmap": "",
-        }
-
     def IsActive(self):
         if FreeCAD.ActiveDocument == None:
             return False
@@ -32,27 +24,49 @@ class PropagateMenu:
             return True
 
     def Activated(self):
-        myObj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython", "PROP")
-        PropagatePart(myObj)
-        myObj.ViewObject.Proxy = 0
-
-        FreeCAD.ActiveDocument.recompute()
+        doc = FreeCAD.ActiveDocument
+        # The propagation is a single undo step, and the document is
+        # recomputed only once, after the object is fully set up.
+        doc.openTransaction("Propagate")
+        try:
+            myObj = doc.addObject("Part::FeaturePython", "PROP")
+            PropagatePart(myObj)
+            myObj.ViewObject.Proxy = 0
+        except Exception:
+            doc.abortTransaction()
+            raise
+        doc.commitTransaction()
+
+        doc.recompute()
 
 
 def get_prop_shape(ray):
-    P1 = FreeCAD.Base.Vector(tuple(ray.origin))
-    if len(ray.childs) > 0:
-        P2 = FreeCAD.Base.Vector(tuple(ray.childs[0].origin))
-    else:
-        P2 = FreeCAD.Base.Vector(tuple(ray.origin + 10.0 * ray.direction))
-
-    if ray.intensity != 0:
-        L1 = [Part.makeLine(P1, P2)]
-        for i in ray.childs:
-            L1 = L1 + get_prop_shape(i)
-    else:
-        L1 = []
-    return L1
+    """Return the list of lines that draw a ray and all its children.
+
+    The ray tree is walked with an explicit stack (depth first, in the same
+    order the children are stored), so long chains of reflections do not
+    hit the recursion limit. Rays with zero intensity, and their children,
+    are not drawn.
+    """
+    Vector = FreeCAD.Base.Vector
+    lines = []
+    stack = [ray]
+    while stack:
+        r = stack.pop()
+        if r.intensity == 0:
+            continue
+        # Build the vectors from 3 floats, this avoids iterating the numpy
+        # arrays to create intermediate tuples.
+        x, y, z = r.origin.tolist()
+        P1 = Vector(x, y, z)
+        if len(r.childs) > 0:
+            x, y, z = r.childs[0].origin.tolist()
+        else:
+            x, y, z = (r.origin + 10.0 * r.direction).tolist()
+        P2 = Vector(x, y, z)
+        lines.append(Part.makeLine(P1, P2))
+        stack.extend(reversed(r.childs))
+    return lines
 
 
 class PropagatePart(WBPart):
@@ -64,7 +78,7 @@ class PropagatePart(WBPart):
         self.S.propagate()
 
     def execute(self, obj):
-        raydict = {}
+        raydict = defaultdict(list)
         raylist = []
         colorlist = []
 
@@ -74,11 +88,14 @@ class PropagatePart(WBPart):
         if hasattr(self, "S"):
             for ray in self.S.prop_ray:
                 llines = get_prop_shape(ray)
+                if not llines:
+                    # Dark ray, nothing to draw or color
+                    continue
                 wl = ray.wavelength
-                raydict[wl] = llines + raydict.get(wl, [])
-                raylist = raylist + llines
-                r, g, b = wavelength2RGB(wl)
-                colorlist = colorlist + [(r, g, b, 0.0)] * len(llines)
+                raydict[wl].extend(llines)
+                raylist.extend(llines)
+                r, g, b = wavelengthToRGB(wl)
+                colorlist.extend([(r, g, b, 0.0)] * len(llines))
             lines = Part.makeCompound(raylist)
             obj.Shape = lines
             obj.ViewObject.LineColorArray = colorlist
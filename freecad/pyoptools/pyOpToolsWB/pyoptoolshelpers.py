@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
+from functools import lru_cache
+
 import FreeCAD
 from pyoptools.raytrace.system import System
 from freecad.pyoptools.pyOpToolsWB.qthelpers import outputDialog
 from math import radians, degrees, cos, atan2, asin, pi
 from numpy.linalg import inv
 import pyoptools.raytrace.mat_lib as matlib
+from pyoptools.misc.pmisc.misc import wavelength2RGB
 
 def getActiveSystem():
     """Return the pyoptools optical system representation.
@@ -17,8 +20,12 @@ def getActiveSystem():
     complist = []
 
     for obj in objs:
-        # All pyoptools components have a ComponentType attribute.
-        if not hasattr(obj, "ComponentType"):
+        # All pyoptools components are Part::FeaturePython objects with a
+        # ComponentType attribute. TypeId is checked first, as it is much
+        # cheaper than probing the properties with hasattr.
+        if obj.TypeId != "Part::FeaturePython" or not hasattr(
+            obj, "ComponentType"
+        ):
             print(
                 "Object {} not recognized by pyoptools, ignored.".format(
                     obj.Label
@@ -101,8 +108,56 @@ def getActiveSystem():
 
     return S, rays
 
+def makePlacement(X, Y, Z, Xrot, Yrot, Zrot):
+    """Return the placement of a component.
+
+    The rotations are applied first around X, then Y, then Z, as the
+    components are positioned in the GUI.
+
+    Parameters
+    ----------
+    X, Y, Z : float
+        Position of the component.
+    Xrot, Yrot, Zrot : float
+        Rotation angles around each axis, in degrees.
+
+    Returns
+    -------
+    FreeCAD.Placement
+    """
+    # Rotation(yaw, pitch, roll) is Rz*Ry*Rx, the same as rotating a matrix
+    # around X, Y and Z in turn, but without building the matrix.
+    return FreeCAD.Placement(
+        FreeCAD.Vector(X, Y, Z), FreeCAD.Rotation(Zrot, Yrot, Xrot)
+    )
+
+
+@lru_cache(maxsize=256)
+def wavelengthToRGB(wavelength):
+    """Return the color used to draw a wavelength.
+
+    Cached version of pyoptools wavelength2RGB. The sources and the
+    propagations ask for the same few wavelengths over and over.
+
+    Parameters
+    ----------
+    wavelength : float
+        Wavelength in micrometers.
+
+    Returns
+    -------
+    tuple of float
+        (r, g, b) color, each component between 0 and 1.
+    """
+    return tuple(wavelength2RGB(wavelength))
+
+
+@lru_cache(maxsize=None)
 def getMaterial(matcat, matref):
     """Returns a pyoptools valid material instance, 
+
+    The result is cached, as every component calls this each time the system
+    is propagated and the glass catalogs are indexed by name.
     """
 
     if matcat == "Value":
@@ -112,5 +167,41 @@ def getMaterial(matcat, matref):
     else:
         material = getattr(matlib.material, matcat)[matref]
 
-    return material 
-    
+    return material
+
+
+@lru_cache(maxsize=None)
+def getGlassCatalogs():
+    """Return the glass catalogs with their sorted material names.
+
+    The list is built the first time the function is called and reused after
+    that, so the dialogs do not sort the catalogs each time they are opened.
+
+    Returns
+    -------
+    tuple of (str, tuple of str)
+        Name of each glass catalog and the sorted names of its materials.
+    """
+    return tuple(
+        (lib, tuple(sorted(matlib.material.get_glass_materials_from_library(lib))))
+        for lib in matlib.material.get_glass_libraries()
+    )
+
+
+@lru_cache(maxsize=None)
+def getComponentCatalogs():
+    """Return the component catalogs with their sorted part references.
+
+    As `getGlassCatalogs`, the list is only built once.
+
+    Returns
+    -------
+    tuple of (str, tuple of str)
+        Name of each component catalog and the sorted references of its parts.
+    """
+    from pyoptools.raytrace.library import library
+
+    return tuple(
+        (catalog, tuple(sorted(getattr(library, catalog).parts())))
+        for catalog in library.catalogs()
+    )
@@ -2,6 +2,11 @@ import FreeCAD
 from PySide import QtCore, QtGui
 import os
 
+# Directory holding the .ui files, looked up once instead of on every dialog
+GUI_DIR = os.path.join(FreeCAD.ConfigGet("UserAppData"), "Mod",
+                       "pyOpToolsWorkbench", "freecad", "pyoptools", "GUI")
+
+
 def outputDialog(msg, yn=False):
     """ Auxiliary function to create a dialog in pyside.
 
@@ -28,7 +33,4 @@ def outputDialog(msg, yn=False):
 def getUIFilePath(targetfile):
     """Helper function to find UI files"""
 
-    ui_file_path = os.path.join(FreeCAD.ConfigGet("UserAppData"), "Mod",
-                        "pyOpToolsWorkbench", "freecad", "pyoptools",
-                        "GUI",targetfile)
-    return ui_file_path
+    return os.path.join(GUI_DIR, targetfile)
@@ -3,12 +3,13 @@
 
 import FreeCAD
 import FreeCADGui
+import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import makePlacement, wavelengthToRGB
 
-from pyoptools.misc.pmisc.misc import wavelength2RGB
 from pyoptools.raytrace.ray import Ray
-from math import tan, radians
+from math import tan
 from FreeCAD import Units
 import FreeCAD
 
@@ -30,17 +31,9 @@ class RayGUI(WBCommandGUI):
         wavelength = self.form.wavelength.value()
         enabled = self.form.Enabled.isChecked()
 
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-
-        m.move((X, Y, Z))
-
         obj = InsertRay(wavelength, "R", enabled)
 
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
 
         FreeCADGui.Control.closeDialog()
 
@@ -49,14 +42,6 @@ class RayMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, RayGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Add Ray Source",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Ray Source",
-            "Pixmap": "",
-        }
-
 
 class RayPart(WBPart):
     def __init__(self, obj, wavelength=633, enabled=True):
@@ -70,7 +55,7 @@ class RayPart(WBPart):
         obj.wl = Units.Quantity("{} nm".format(wavelength))
         obj.Enabled = enabled
 
-        r, g, b = wavelength2RGB(obj.wl.getValueAs("µm").Value)
+        r, g, b = wavelengthToRGB(obj.wl.getValueAs("µm").Value)
         obj.ViewObject.ShapeColor = (r, g, b, 0.0)
 
     def propertyChanged(self, obj, prop):
@@ -78,7 +63,7 @@ class RayPart(WBPart):
         # the standard onChanged
 
         if prop == "wl":
-            r, g, b = wavelength2RGB(obj.wl.getValueAs("µm").Value)
+            r, g, b = wavelengthToRGB(obj.wl.getValueAs("µm").Value)
             obj.ViewObject.ShapeColor = (r, g, b, 0.0)
 
     def pyoptools_repr(self, obj):
@@ -94,8 +79,6 @@ class RayPart(WBPart):
         ]
 
     def execute(self, obj):
-        import Part
-
         d1 = Part.makeCylinder(0.25, 10)
         d2 = Part.makeCone(0.5, 0, 1)
         d2.translate(FreeCAD.Base.Vector(0, 0, 10))
@@ -1,40 +1,132 @@
 # -*- coding: utf-8 -*-
 """Classes used to define an array of rays."""
+from functools import lru_cache
+from itertools import chain
+
 import FreeCAD
 import FreeCADGui
+import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
-from pyoptools.misc.pmisc.misc import wavelength2RGB
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import makePlacement, wavelengthToRGB
 import pyoptools.raytrace.ray.ray_source as rs_lib
-from math import tan, radians
-from numpy import linspace, dot, array, cos, sin
+from math import tan, radians, cos, sin
+from numpy import linspace, dot, array, meshgrid, zeros
 
 
 def rot_mat(r):
-    c = cos(r)
-    s = sin(r)
-
-    rx = array([[1.0, 0.0, 0.0], [0.0, c[0], -s[0]], [0.0, s[0], c[0]]])
+    """Return the rotation matrix Rz*Ry*Rx for the angles r=(rx, ry, rz).
 
-    ry = array([[c[1], 0.0, s[1]], [0.0, 1.0, 0.0], [-s[1], 0.0, c[1]]])
+    The product is written out, so only one array is created.
+    """
+    cx, cy, cz = cos(r[0]), cos(r[1]), cos(r[2])
+    sx, sy, sz = sin(r[0]), sin(r[1]), sin(r[2])
 
-    rz = array([[c[2], -s[2], 0.0], [s[2], c[2], 0.0], [0.0, 0.0, 1.0]])
-    tm = dot(rz, dot(ry, rx))
-    return tm
+    return array(
+        [
+            [cy * cz, sx * sy * cz - cx * sz, cx * sy * cz + sx * sz],
+            [cy * sz, sx * sy * sz + cx * cz, cx * sy * sz - sx * cz],
+            [-sy, sx * cy, cx * cy],
+        ]
+    )
 
 
 def rot_mat_i(r):
-
-    c = cos(r)
-    s = sin(r)
-
-    rx = array([[1.0, 0.0, 0.0], [0.0, c[0], s[0]], [0.0, -s[0], c[0]]])
-
-    ry = array([[c[1], 0.0, -s[1]], [0.0, 1.0, 0.0], [s[1], 0.0, c[1]]])
-
-    rz = array([[c[2], s[2], 0.0], [-s[2], c[2], 0.0], [0.0, 0.0, 1.0]])
-
-    return dot(rx, dot(ry, rz))
+    """Return the inverse of rot_mat(r), Rx^-1*Ry^-1*Rz^-1."""
+    # The inverse of a rotation matrix is its transpose
+    return rot_mat(r).T
+
+
+def grid_origins(rm, origin, Sx, Sy, Nx, Ny):
+    """Return the origins of the sources of a rays array.
+
+    All the grid points are rotated and translated with a single matrix
+    product. The x coordinate changes slowest.
+
+    Parameters
+    ----------
+    rm : ndarray
+        3x3 rotation matrix of the array.
+    origin : tuple of float
+        Position of the center of the array.
+    Sx, Sy : float
+        Size of the array in X and Y.
+    Nx, Ny : int
+        Number of sources in X and Y.
+
+    Returns
+    -------
+    list of tuple
+        (x, y, z) origin of each source.
+    """
+    xs, ys = meshgrid(
+        linspace(-Sx / 2, Sx / 2, Nx), linspace(-Sy / 2, Sy / 2, Ny), indexing="ij"
+    )
+    grid = array((xs.ravel(), ys.ravel(), zeros(xs.size)))
+    return list(map(tuple, (dot(rm, grid).T + origin).tolist()))
+
+
+# Ray source function, and span argument built from the angle in radians,
+# for each distribution
+_SOURCES = {
+    "polar": (rs_lib.point_source_p, lambda a: a),
+    "cartesian": (rs_lib.point_source_c, lambda a: (a, a)),
+}
+
+
+def point_sources(source, origins, **kwargs):
+    """Return the rays of a set of equal point sources.
+
+    Parameters
+    ----------
+    source : callable
+        Ray source function from pyoptools, for example
+        ``rs_lib.point_source_p``.
+    origins : list of tuple
+        Origin of each source.
+    **kwargs
+        Arguments passed to ``source``, the same for all the sources.
+
+    Returns
+    -------
+    list of Ray
+        The rays of all the sources, in the order of ``origins``.
+    """
+    return list(chain.from_iterable(source(origin=o, **kwargs) for o in origins))
+
+
+def buildarray(angle, Sx, Sy, Nx, Ny):
+    """Return the shape drawn for an array of sources.
+
+    The shapes are cached, as execute is called for any property change and
+    most of them do not change the drawing. A copy is returned so the cached
+    shape is never shared.
+    """
+    return _buildarray(angle, Sx, Sy, Nx, Ny).copy()
+
+
+@lru_cache(maxsize=32)
+def _buildarray(angle, Sx, Sy, Nx, Ny):
+    # Build the cone once, and place a copy of it on each grid point,
+    # instead of building a new cone for each source.
+    # The polar and cartesian distributions use the same cone.
+    # Todo: Cambiar cono a piramide para la distribucion cartesiana
+    cone = Part.makeCone(0, 5 * tan(radians(angle)), 5)
+
+    # Plain floats, so the vectors are not built from numpy scalars
+    xs = linspace(-Sx / 2, Sx / 2, Nx).tolist()
+    ys = linspace(-Sy / 2, Sy / 2, Ny).tolist()
+    Vector = FreeCAD.Vector
+    d = [None] * (len(xs) * len(ys))
+    k = 0
+    for x in xs:
+        for y in ys:
+            c = cone.copy()
+            c.translate(Vector(x, y, 0))
+            d[k] = c
+            k += 1
+
+    return Part.makeCompound(d)
 
 
 class RaysArrayGUI(WBCommandGUI):
@@ -53,10 +145,10 @@ class RaysArrayGUI(WBCommandGUI):
         Oz = self.form.Zrot.value()
 
         Sx = self.form.SX.value()
-        Sy = self.form.SX.value()
+        Sy = self.form.SY.value()
 
         Nx = self.form.NX.value()
-        Ny = self.form.NX.value()
+        Ny = self.form.NY.value()
 
         nr = self.form.nr.value()
         na = self.form.na.value()
@@ -66,18 +158,9 @@ class RaysArrayGUI(WBCommandGUI):
 
         angle = self.form.ang.value()
 
-        m = FreeCAD.Matrix()
-
-        m.rotateX(radians(Ox))
-        m.rotateY(radians(Oy))
-        m.rotateZ(radians(Oz))
-
-        m.move((X,Y,Z))
-
         obj=InsertRArray(Sx,Sy,Nx,Ny, nr,na, angle, distribution,wavelength,"S",enabled)
 
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Ox, Oy, Oz)
         FreeCADGui.Control.closeDialog()
 
 
@@ -85,14 +168,6 @@ class RaysArrayMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, RaysArrayGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Add Array of Sources",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Array of Sources",
-            "Pixmap": "",
-        }
-
 
 class RaysArrayPart(WBPart):
     def __init__(self,obj,Sx = 5,Sy = 5,Nx = 5 ,Ny= 5,nr=6,na=6,angle=10,distribution="polar",wavelength=633,enabled=True):
@@ -107,7 +182,7 @@ class RaysArrayPart(WBPart):
         obj.addProperty("App::PropertyFloat","ySize").ySize = Sy
         obj.addProperty("App::PropertyInteger","Nx").Nx = Nx
         obj.addProperty("App::PropertyInteger","Ny").Ny = Ny
-        r,g,b = wavelength2RGB(wavelength/1000.)
+        r,g,b = wavelengthToRGB(wavelength/1000.)
 
         obj.ViewObject.ShapeColor = (r,g,b,0.)
 
@@ -117,7 +192,7 @@ class RaysArrayPart(WBPart):
         # the standard onChanged
 
         if prop == "wavelength":
-            r,g,b = wavelength2RGB(obj.wavelength/1000.)
+            r,g,b = wavelengthToRGB(obj.wavelength/1000.)
             obj.ViewObject.ShapeColor = (r,g,b,0.)
 
 
@@ -131,36 +206,26 @@ class RaysArrayPart(WBPart):
         wl = obj.wavelength
 
         RZ, RY, RX = pla.Rotation.toEuler()
-        rm = rot_mat((radians(RX), radians(RY), radians(RZ)))
         dire = (radians(RX), radians(RY), radians(RZ))
+        rm = rot_mat(dire)
 
         r = []
         if obj.Enabled:
-            if dist == "polar":
-                for x in linspace(-obj.xSize / 2, obj.xSize / 2, obj.Nx):
-                    for y in linspace(-obj.ySize / 2, obj.ySize / 2, obj.Ny):
-                        xr, yr, zr = dot(rm, array((x, y, 0), dtype="float64"))
-                        r = r + rs_lib.point_source_p(
-                            origin=(X + xr, Y + yr, Z + zr),
-                            direction=dire,
-                            span=radians(ang),
-                            num_rays=(nr, na),
-                            wavelength=wl / 1000.0,
-                            label="",
-                        )
-
-            elif dist == "cartesian":
-                for x in linspace(-obj.xSize / 2, obj.xSize / 2, obj.Nx):
-                    for y in linspace(-obj.ySize / 2, obj.ySize / 2, obj.Ny):
-                        xr, yr, zr = dot(rm, array((x, y, 0), dtype="float64"))
-                        r = r + rs_lib.point_source_c(
-                            origin=(X + xr, Y + yr, Z + zr),
-                            direction=dire,
-                            span=(radians(ang), radians(ang)),
-                            num_rays=(nr, na),
-                            wavelength=wl / 1000.0,
-                            label="",
-                        )
+            source = _SOURCES.get(dist)
+            if source is not None:
+                source_func, span = source
+                origins = grid_origins(
+                    rm, (X, Y, Z), obj.xSize, obj.ySize, obj.Nx, obj.Ny
+                )
+                r = point_sources(
+                    source_func,
+                    origins,
+                    direction=dire,
+                    span=span(radians(ang)),
+                    num_rays=(nr, na),
+                    wavelength=wl / 1000.0,
+                    label="",
+                )
             elif dist == "random":
                 print("random ray distribution, not implemented yet")
             else:
@@ -169,28 +234,16 @@ class RaysArrayPart(WBPart):
         return r
 
     def execute(self, obj):
-        import Part, FreeCAD
-
         dist = obj.distribution.lower()
 
         if dist not in ["polar", "cartesian"]:
             obj.distribution = "polar"
             print("Ray Distribution not understood, changing it to polar")
 
-        if dist == "polar":
-            r = 5 * tan(radians(obj.angle))
-            d = []
-            for x in linspace(-obj.xSize / 2, obj.xSize / 2, obj.Nx):
-                for y in linspace(-obj.ySize / 2, obj.ySize / 2, obj.Ny):
-                    d.append(Part.makeCone(0, r, 5, FreeCAD.Vector(x, y, 0)))
-        else:  # Todo: Cambiar cono a piramide
-            r = 5 * tan(radians(obj.angle))
-            d = []
-            for x in linspace(-obj.xSize / 2, obj.xSize / 2, obj.Nx):
-                for y in linspace(-obj.ySize / 2, obj.ySize / 2, obj.Ny):
-                    d.append(Part.makeCone(0, r, 5, FreeCAD.Vector(x, y, 0)))
-
-        obj.Shape = Part.makeCompound(d)
+        # Only the shape parameters are used as key, so editing the
+        # wavelength, the number of rays or the enabled flag does not
+        # rebuild the cones.
+        obj.Shape = buildarray(obj.angle, obj.xSize, obj.ySize, obj.Nx, obj.Ny)
 
 
 def InsertRArray(Sx=5,Sy=5,Nx=5,Ny=5, nr =10,na=10, angle=5, distribution="polar",wavelength=633,ID = "S",enabled = True):
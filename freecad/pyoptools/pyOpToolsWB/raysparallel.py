@@ -2,10 +2,11 @@
 """Classes used to define a beam of parallel rays."""
 import FreeCAD
 import FreeCADGui
+import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import makePlacement, wavelengthToRGB
 
-from pyoptools.misc.pmisc.misc import wavelength2RGB
 import pyoptools.raytrace.ray.ray_source as rs_lib
 from FreeCAD import Units
 from math import radians
@@ -33,17 +34,9 @@ class RaysParallelGUI(WBCommandGUI):
         enabled = self.form.Enabled.isChecked()
 
         D = self.form.D.value()
-        m = FreeCAD.Matrix()
-
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-
-        m.move((X, Y, Z))
         obj = InsertRPar(nr, na, distribution, wavelength, D, "S", enabled)
 
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -51,14 +44,6 @@ class RaysParallelMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, RaysParallelGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Add Parallel Ray Source",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Parallel Ray Source",
-            "Pixmap": "",
-        }
-
 
 class RaysParPart(WBPart):
     def __init__(self,obj,nr=6,na=6,distribution="polar",wavelength=633, D=5,enabled=True):
@@ -77,7 +62,7 @@ class RaysParPart(WBPart):
         obj.wl = Units.Quantity("{} nm".format(wavelength)) # wavelength is received in nm
         obj.D = D
         obj.Enabled = enabled
-        r, g, b = wavelength2RGB(obj.wl.getValueAs("µm").Value)
+        r, g, b = wavelengthToRGB(obj.wl.getValueAs("µm").Value)
 
         obj.ViewObject.ShapeColor = (r, g, b, 0.0)
 
@@ -87,7 +72,7 @@ class RaysParPart(WBPart):
         # the standard onChanged
 
         if prop == "wl":
-            r, g, b = wavelength2RGB(obj.wl.getValueAs("µm").Value)
+            r, g, b = wavelengthToRGB(obj.wl.getValueAs("µm").Value)
             obj.ViewObject.ShapeColor = (r, g, b, 0.0)
 
     def pyoptools_repr(self, obj):
@@ -121,8 +106,6 @@ class RaysParPart(WBPart):
         return r
 
     def execute(self, obj):
-        import Part, FreeCAD
-
         dist = obj.distribution.lower()
 
         if dist not in ["polar", "cartesian"]:
@@ -135,12 +118,11 @@ class RaysParPart(WBPart):
             # d.translate(FreeCAD.Base.Vector(0,0,-0.5))
         else:  # Cartesian
             # Todo: Crear una piramide en lugar de un cono
-            d = Part.makeCone(0, 10, 10, dir)
+            d = Part.makeCone(0, 10, 10)
             d.translate(FreeCAD.Base.Vector(0, 0, -0.5))
         obj.Shape = d
 
 
-
 def InsertRPar(nr=6, na=6,distribution="polar",wavelength=633,D=5,ID="S",enabled = True):
     import FreeCAD
     myObj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython",ID)
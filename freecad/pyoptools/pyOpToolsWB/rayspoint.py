@@ -5,8 +5,8 @@ import FreeCADGui
 import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import makePlacement, wavelengthToRGB
 
-from pyoptools.misc.pmisc.misc import wavelength2RGB
 import pyoptools.raytrace.ray.ray_source as rs_lib
 from math import tan, radians
 from FreeCAD import Units
@@ -35,18 +35,11 @@ class RaysPointGUI(WBCommandGUI):
         angle = self.form.ang.value()
         enabled = self.form.Enabled.isChecked()
 
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-
-        m.move((X, Y, Z))
         obj = InsertRPoint(
             nr, na, distribution, wavelength, angle, "S", enabled
         )
 
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
 
         FreeCADGui.Control.closeDialog()
 
@@ -55,14 +48,6 @@ class RaysPointMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, RaysPointGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Add Point Source",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Point Source",
-            "Pixmap": "",
-        }
-
 
 class RaysPointPart(WBPart):
     def __init__(self,obj,nr=6,na=6,distribution="polar",wavelength=633, angle=30,enabled = True):
@@ -80,7 +65,7 @@ class RaysPointPart(WBPart):
         obj.angle = angle
         obj.Enabled = enabled
 
-        r, g, b = wavelength2RGB(obj.wl.getValueAs("µm").Value)
+        r, g, b = wavelengthToRGB(obj.wl.getValueAs("µm").Value)
         obj.ViewObject.ShapeColor = (r, g, b, 0.0)
 
     def propertyChanged(self, obj, prop):
@@ -89,7 +74,7 @@ class RaysPointPart(WBPart):
         # the standard onChanged
 
         if prop == "wl":
-            r, g, b = wavelength2RGB(
+            r, g, b = wavelengthToRGB(
                 obj.wl.getValueAs("µm").Value
             )  # se pasa wl a um
             obj.ViewObject.ShapeColor = (r, g, b, 0.0)
@@ -1,23 +1,41 @@
 # -*- coding: utf-8 -*-
 import FreeCAD
+from numpy import array, empty
 from .pyopPlot import *
 
 #TODO: Plot no esta funcionando en Freecad 18 ni 19. Se inhabilita 
 
 from .propagate import PropagatePart
 
+def get_hit_xy(hl):
+    """Return the X, Y coordinates of the hits of a sensor.
+
+    The hit points (the first element of each hit_list entry) are stacked
+    in a single array, so the plots can use its columns directly.
+
+    Parameters
+    ----------
+    hl : list
+        hit_list of a pyoptools CCD.
+
+    Returns
+    -------
+    ndarray
+        (N, 2) array with the X and Y of each hit.
+    """
+    if len(hl) == 0:
+        return empty((0, 2))
+    # Hitlist[1] points to the incident ray
+    #col=wavelength2RGB(i[1].wavelength)
+    return array([i[0] for i in hl], dtype="float64")[:, :2]
+
+
 class ReportsMenu:
     def __init__(self):
         #Esta no tiene GUI, no necesitamos heredar de WBCommandMenu
         #WBCommandMenu.__init__(self,None)
         pass
 
-    def GetResources(self):
-        return {"MenuText": "Reports",
-                #"Accel": "Ctrl+M",
-                "ToolTip": "Generate reports",
-                "Pixmap": ""}
-
     def IsActive(self):
         if FreeCAD.ActiveDocument == None:
             return False
@@ -27,43 +45,36 @@ class ReportsMenu:
     def Activated(self):
         objs = FreeCAD.ActiveDocument.Objects
 
-
         #Eliminar los grupos y los rayos
-        opobjs = list(filter(lambda x:hasattr(x,"ComponentType"),objs))
-
-        #Buscar los sensores
-        a_sensors = list(filter(lambda x: x.ComponentType=="Sensor",opobjs))
-
-        #Mirar cuales estan activos
+        opobjs = [x for x in objs if hasattr(x,"ComponentType")]
 
-        sensors = list(filter(lambda x:x.Enabled, a_sensors))
+        #Buscar los sensores activos, y sacar sus labels
+        slabels = [x.Label for x in opobjs
+                   if x.ComponentType=="Sensor" and x.Enabled]
 
+        #Sacar los sistemas opticos de las propagaciones
+        ss = [x.Proxy.S for x in opobjs if x.ComponentType=="Propagation"]
 
-        #Sacar los labels de los sensores
-        slabels = list(map(lambda x:x.Label,sensors))
-
-        #Buscar las propagaciones
-        props = list(filter(lambda x: x.ComponentType=="Propagation",opobjs))
+        # Without propagations there is nothing to plot
+        if not ss:
+            return
 
-        #Sacar los sistemas opticos de las propagaciones
-        ss = list(map(lambda x: x.Proxy.S, props))
-        
-        for s in ss:
-            for n in slabels:
-                ccd = s[n][0]
-                hl=ccd.hit_list
-                X=[]
-                Y=[]
-                if len(hl) >0:
-                    for i in hl:
-                        p=i[0]
-                        # Hitlist[1] points to the incident ray
-                        #col=wavelength2RGB(i[1].wavelength)
-                        X.append(p[0])
-                        Y.append(p[1])
-                        #COL.append(col)
-                fig=figure()
-                fig.axes.plot(X,Y,"o")
-                fig.axes.axis("equal")
-                fig.axes.set_title(n)
-                fig.update()
+        # One figure per sensor, with the hits of each propagation drawn as
+        # a separate series, and a single redraw per figure. The figure is
+        # only created for the sensors found in some propagation.
+        for n in slabels:
+            fig = None
+            for s in ss:
+                try:
+                    ccd = s[n][0]
+                except KeyError:
+                    continue
+                if fig is None:
+                    fig = figure()
+                XY = get_hit_xy(ccd.hit_list)
+                fig.axes.plot(XY[:, 0], XY[:, 1], "o")
+            if fig is None:
+                continue
+            fig.axes.axis("equal")
+            fig.axes.set_title(n)
+            fig.update()
@@ -6,11 +6,10 @@ import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
 from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
-from math import radians
 
 
 class RightAnglePrismGUI(WBCommandGUI):
@@ -45,13 +44,7 @@ class RightAnglePrismGUI(WBCommandGUI):
             rlb=rlb,
             rhy=rhy,
         )
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -59,14 +52,6 @@ class RightAnglePrismMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, RightAnglePrismGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Right Angle Prism",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Right Angle Prism",
-            "Pixmap": "",
-        }
-
 
 class RightAnglePrismPart(WBPart):
     def __init__(self, obj, S=50, matcat="", matref="", rla=0, rlb=0, rhy=0):
@@ -7,11 +7,10 @@ import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
 from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
-from math import radians
 
 _wrn = FreeCAD.Console.PrintWarning
 
@@ -39,13 +38,7 @@ class RoundMirrorGUI(WBCommandGUI):
             matref = self.form.Reference.currentText()
 
         obj = InsertRM(Ref, Th, D, ID="M1", matcat=matcat, matref=matref)
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -53,14 +46,6 @@ class RoundMirrorMenu(WBCommandMenu):
     def __init__(self):
         super().__init__(RoundMirrorGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Round Mirror",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Round Mirror",
-            "Pixmap": "",
-        }
-
 
 class RoundMirrorPart(WBPart):
     """RoundMirrorPart class.
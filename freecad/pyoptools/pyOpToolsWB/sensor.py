@@ -2,12 +2,13 @@
 """Classes used to define a light sensor."""
 import FreeCAD
 import FreeCADGui
+import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import makePlacement
 
 import pyoptools.raytrace.comp_lib as comp_lib
 import pyoptools.raytrace.mat_lib as matlib
-from math import radians
 
 
 class SensorGUI(WBCommandGUI):
@@ -27,13 +28,7 @@ class SensorGUI(WBCommandGUI):
 
         obj = InsertSen(height, width, ID="SEN")
 
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
         FreeCADGui.Control.closeDialog()
 
 
@@ -41,14 +36,6 @@ class SensorMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, SensorGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Sensor",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Sensor",
-            "Pixmap": "",
-        }
-
 
 class SensorPart(WBPart):
     def __init__(self, obj, height=10, width=10):
@@ -71,8 +58,6 @@ class SensorPart(WBPart):
         return S
 
     def execute(self, obj):
-        import Part, FreeCAD
-
         d = Part.makePlane(
             obj.Width.Value,
             obj.Height.Value,
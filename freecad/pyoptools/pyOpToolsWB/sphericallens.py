@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """Classes used to define a Spherical lens."""
+from functools import lru_cache
+from math import sqrt
 
 import FreeCAD
 import FreeCADGui
@@ -10,11 +12,7 @@ from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import (
     placementWidget,
 )
 from freecad.pyoptools.pyOpToolsWB.widgets.materialWidget import materialWidget
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
-
-import pyoptools.raytrace.comp_lib as comp_lib
-import pyoptools.raytrace.mat_lib as matlib
-from math import radians
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial, makePlacement
 
 _wrn = FreeCAD.Console.PrintWarning
 
@@ -51,14 +49,11 @@ class SphericalLensGUI(WBCommandGUI):
             ID="L",
             matcat=material_catalog,
             matref=material_reference,
+            recompute=False,
         )
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
+        # Recompute once the placement is set, not in the Insert helper
+        FreeCAD.ActiveDocument.recompute()
         FreeCADGui.Control.closeDialog()
 
 
@@ -66,14 +61,6 @@ class SphericalLensMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, SphericalLensGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Spherical Lens",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Spherical Lens",
-            "Pixmap": "",
-        }
-
 
 class SphericalLensPart(WBPart):
     """A FreeCAD part for creating spherical optical lenses.
@@ -102,6 +89,11 @@ class SphericalLensPart(WBPart):
     A curvature of 0 creates a flat surface.
     """
 
+    NoRecomputeProperties = WBPart.NoRecomputeProperties + (
+        "MaterialCatalog",
+        "MaterialReference",
+    )
+
     def __init__(
         self,
         obj,
@@ -164,6 +156,7 @@ class SphericalLensPart(WBPart):
         obj.ViewObject.ShapeColor = (1.0, 1.0, 0.0, 0.0)
 
         obj.ObjectVersion = 1
+        self.setNoRecompute(obj)
 
     def execute(self, obj):
         obj.Shape = buildlens(
@@ -174,6 +167,9 @@ class SphericalLensPart(WBPart):
         )
 
     def pyoptools_repr(self, obj):
+        # Imported here, it is only needed to build the optical system
+        import pyoptools.raytrace.comp_lib as comp_lib
+
         radius = obj.Diameter.Value / 2.0
         thickness = obj.CenterThickness.Value
         curvature_s1 = obj.CurvatureFront
@@ -211,16 +207,80 @@ class SphericalLensPart(WBPart):
         curvature_back = obj.CurvatureBack
         obj.CurvatureBack = (curvature_back, -10, 10, 1e-3)
 
+        # The material properties may have just been added by the migration
+        self.setNoRecompute(obj)
+
 
-def InsertSL(CS1=0.01, CS2=-0.01, CT=10, D=50, ID="L", matcat="", matref=""):
+def InsertSL(
+    CS1=0.01, CS2=-0.01, CT=10, D=50, ID="L", matcat="", matref="", recompute=True
+):
     myObj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython", ID)
     SphericalLensPart(myObj, CS1, CS2, CT, D, matcat, matref)
     myObj.ViewObject.Proxy = 0  # this is mandatory unless we code the ViewProvider too
-    FreeCAD.ActiveDocument.recompute()
+    # The dialogs recompute themselves, once the placement is set
+    if recompute:
+        FreeCAD.ActiveDocument.recompute()
     return myObj
 
 
 def buildlens(CS1, CS2, D, CT):
+    """Return the shape of a spherical lens.
+
+    The Boolean operations are the slow part of the build, and the same
+    lens is built again on every recompute (and by the doublet and lens
+    data parts), so the shapes are cached by their (rounded) parameters.
+    A copy is returned, as the callers translate the shape.
+    """
+    key = tuple(round(float(v), 9) for v in (CS1, CS2, D, CT))
+    return _buildlens(*key).copy()
+
+
+def _sag(C, r):
+    """Sag at radius r of a spherical surface with curvature C."""
+    return C * r ** 2 / (1 + sqrt(1 - (C * r) ** 2))
+
+
+def _profile_edge(C, z0, r):
+    """Return the profile edge of a lens surface, from the axis to r."""
+    p0 = FreeCAD.Vector(0, 0, z0)
+    p1 = FreeCAD.Vector(r, 0, z0 + _sag(C, r))
+    if C == 0:
+        return Part.LineSegment(p0, p1).toShape()
+    pm = FreeCAD.Vector(r / 2, 0, z0 + _sag(C, r / 2))
+    return Part.Arc(p0, pm, p1).toShape()
+
+
+@lru_cache(maxsize=64)
+def _buildlens(CS1, CS2, D, CT):
+    r = D / 2.0
+
+    # If both surfaces cover the full aperture and the edge thickness is
+    # positive, the lens is made revolving its profile around the Z axis,
+    # this is much faster than the Boolean operations.
+    if abs(CS1 * r) < 1 and abs(CS2 * r) < 1:
+        z1 = -CT / 2 + _sag(CS1, r)
+        z2 = CT / 2 + _sag(CS2, r)
+        if CT > 0 and z2 > z1:
+            front = _profile_edge(CS1, -CT / 2, r)
+            back = _profile_edge(CS2, CT / 2, r)
+            wire = Part.Wire(
+                [
+                    front,
+                    Part.LineSegment(
+                        FreeCAD.Vector(r, 0, z1), FreeCAD.Vector(r, 0, z2)
+                    ).toShape(),
+                    back,
+                    Part.LineSegment(
+                        FreeCAD.Vector(0, 0, CT / 2), FreeCAD.Vector(0, 0, -CT / 2)
+                    ).toShape(),
+                ]
+            )
+            return Part.Face(wire).revolve(
+                FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), 360
+            )
+
+    # Any other case (spheres smaller than the lens, crossing surfaces) is
+    # built as before, with the Boolean operations.
     d = Part.makeCylinder(D / 2.0, CT + D)
     d.translate(FreeCAD.Base.Vector(0, 0, -(CT + D) / 2))
 
@@ -3,15 +3,10 @@
 
 import FreeCAD
 import FreeCADGui
+import Part
 from .wbcommand import WBCommandGUI, WBCommandMenu, WBPart
 from freecad.pyoptools.pyOpToolsWB.widgets.placementWidget import placementWidget
-from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getMaterial
-
-import pyoptools.raytrace.comp_lib as comp_lib
-import pyoptools.raytrace.mat_lib as matlib
-from pyoptools.raytrace.system.idealcomponent import IdealThickLens
-from pyoptools.raytrace.shape.circular import Circular
-from math import radians
+from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import makePlacement
 
 
 class ThickLensGUI(WBCommandGUI):
@@ -44,15 +39,23 @@ class ThickLensGUI(WBCommandGUI):
         PupRS = self.form.RefSurf1.isChecked()
 
         obj = InsertTL(
-            Th, D, PP1, PP2, f, PupP, PupD, PupEn, PupRS, showpp, showft, ID="L"
+            Th,
+            D,
+            PP1,
+            PP2,
+            f,
+            PupP,
+            PupD,
+            PupEn,
+            PupRS,
+            showpp,
+            showft,
+            ID="L",
+            recompute=False,
         )
-        m = FreeCAD.Matrix()
-        m.rotateX(radians(Xrot))
-        m.rotateY(radians(Yrot))
-        m.rotateZ(radians(Zrot))
-        m.move((X, Y, Z))
-        p1 = FreeCAD.Placement(m)
-        obj.Placement = p1
+        obj.Placement = makePlacement(X, Y, Z, Xrot, Yrot, Zrot)
+        # Recompute once the placement is set, not in the Insert helper
+        FreeCAD.ActiveDocument.recompute()
         FreeCADGui.Control.closeDialog()
 
 
@@ -60,16 +63,11 @@ class ThickLensMenu(WBCommandMenu):
     def __init__(self):
         WBCommandMenu.__init__(self, ThickLensGUI)
 
-    def GetResources(self):
-        return {
-            "MenuText": "Thick Lens",
-            # "Accel": "Ctrl+M",
-            "ToolTip": "Add Ideal Thick Lens",
-            "Pixmap": "",
-        }
-
 
 class ThickLensPart(WBPart):
+    # The focal length and the ray trace option are not drawn
+    NoRecomputeProperties = WBPart.NoRecomputeProperties + ("f", "SFRT")
+
     def __init__(
         self,
         obj,
@@ -140,8 +138,13 @@ class ThickLensPart(WBPart):
 
         obj.ViewObject.Transparency = 50
         obj.ViewObject.ShapeColor = (1.0, 0.0, 0.0, 0.0)
+        self.setNoRecompute(obj)
 
     def pyoptools_repr(self, obj):
+        # Imported here, they are only needed to build the optical system
+        from pyoptools.raytrace.system.idealcomponent import IdealThickLens
+        from pyoptools.raytrace.shape.circular import Circular
+
         if not obj.PupEn:
             pupil = None
         else:
@@ -162,41 +165,39 @@ class ThickLensPart(WBPart):
         )
 
     def execute(self, obj):
-        import Part, FreeCAD
-
-        d = Part.makeCylinder(
-            obj.D.Value / 2.0,
-            obj.Thk.Value,
-            FreeCAD.Base.Vector(0, 0, -obj.Thk.Value / 2),
-        )
-        p1 = Part.makeCylinder(
-            obj.D.Value / 2.0,
-            0.01,
-            FreeCAD.Base.Vector(0, 0, obj.PP1P.Value - obj.Thk.Value / 2),
-        )
-        p2 = Part.makeCylinder(
-            obj.D.Value / 2.0,
-            0.01,
-            FreeCAD.Base.Vector(0, 0, obj.Thk.Value / 2 + obj.PP2P.Value),
-        )
-
-        puppos = (
-            obj.PupP.Value - obj.Thk.Value / 2
-            if obj.PupRS
-            else obj.PupP.Value + obj.Thk.Value / 2
-        )
-        pup = Part.makeCylinder(
-            obj.PupD.Value / 2.0, 0.01, FreeCAD.Base.Vector(0, 0, puppos)
-        )
+        radius = obj.D.Value / 2.0
+        thk = obj.Thk.Value
 
+        # The principal planes and the pupil are only built when shown
+        oblist = [
+            Part.makeCylinder(radius, thk, FreeCAD.Base.Vector(0, 0, -thk / 2))
+        ]
         if obj.SPP:
-            oblist = [d, p1, p2]
-        else:
-            oblist = [d]
+            oblist.append(
+                Part.makeCylinder(
+                    radius,
+                    0.01,
+                    FreeCAD.Base.Vector(0, 0, obj.PP1P.Value - thk / 2),
+                )
+            )
+            oblist.append(
+                Part.makeCylinder(
+                    radius,
+                    0.01,
+                    FreeCAD.Base.Vector(0, 0, thk / 2 + obj.PP2P.Value),
+                )
+            )
         if obj.PupEn:
-            oblist = oblist + [pup]
+            puppos = (
+                obj.PupP.Value - thk / 2 if obj.PupRS else obj.PupP.Value + thk / 2
+            )
+            oblist.append(
+                Part.makeCylinder(
+                    obj.PupD.Value / 2.0, 0.01, FreeCAD.Base.Vector(0, 0, puppos)
+                )
+            )
 
-        obj.Shape = Part.makeCompound(oblist)
+        obj.Shape = oblist[0] if len(oblist) == 1 else Part.makeCompound(oblist)
 
 
 # (self,obj,Th=10,D=50,PP1=0,PP2=0,f=100,Pup1P=0, Pup1D=10,Pup1En=False,Pup2P=0, Pup2D=10,Pup2En=False, SPP=False,SFRT=False):
@@ -213,11 +214,14 @@ def InsertTL(
     SPP=False,
     SFRT=False,
     ID="L",
+    recompute=True,
 ):
     import FreeCAD
 
     myObj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython", ID)
     ThickLensPart(myObj, Th, D, PP1, PP2, f, PupP, PupD, PupRS, PupEn, SPP, SFRT)
     myObj.ViewObject.Proxy = 0  # this is mandatory unless we code the ViewProvider too
-    FreeCAD.ActiveDocument.recompute()
+    # The dialog recomputes itself, once the placement is set
+    if recompute:
+        FreeCAD.ActiveDocument.recompute()
     return myObj
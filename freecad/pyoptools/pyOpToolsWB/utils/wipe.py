@@ -1,5 +1,11 @@
 import FreeCAD
 from freecad.pyoptools.pyOpToolsWB.qthelpers import outputDialog
+
+# Set to True to log what is being wiped in the report view
+_DEBUG = False
+_log = FreeCAD.Console.PrintLog
+
+
 def uno():
     pass
 
@@ -7,11 +13,6 @@ class WipeMenu:
     """
     Command to wipe (erase propagations and rays) from the system
     """
-    def GetResources(self):
-        return {"MenuText": "Wipe",
-                "ToolTip": "Delete propagations and rays",
-                "Pixmap": ""}
-
     def IsActive(self):
         if FreeCAD.ActiveDocument is None:
             return False
@@ -26,7 +27,8 @@ class WipeMenu:
             for obj in objs:
                 if hasattr(obj, "ComponentType"):
                     if obj.ComponentType == "Propagation":
-                        print("removing Propagation")
+                        if _DEBUG:
+                            _log("removing Propagation\n")
                         todelete.append(obj.Label)
                         continue
             for obj in todelete:
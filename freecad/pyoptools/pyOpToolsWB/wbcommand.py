@@ -2,6 +2,8 @@
 
 """Helper classes used in the workbench creation."""
 
+from functools import lru_cache
+
 import FreeCAD
 import FreeCADGui
 from freecad.pyoptools.pyOpToolsWB.qthelpers import getUIFilePath
@@ -10,6 +12,42 @@ from PySide import QtGui
 from .wbpart import WBPart
 
 
+@lru_cache(maxsize=None)
+def _uiType(fn):
+    """Return the (form, base) classes compiled from the ui file fn.
+
+    None is returned (and cached) if the file can not be compiled, for
+    example when pyside2uic is not installed, so that file is not compiled
+    again and is loaded with loadUi instead.
+    """
+    try:
+        return FreeCADGui.PySideUic.loadUiType(fn)
+    except Exception:
+        return None
+
+
+def _loadUi(fn):
+    """Return a new widget created from the ui file fn.
+
+    The ui file is parsed and compiled only the first time, the generated
+    classes are cached and reused each time the dialog is opened. As with
+    loadUi, the child widgets are accessible as attributes of the returned
+    widget. If the file can not be compiled, it is loaded with loadUi.
+    """
+    if hasattr(FreeCADGui.PySideUic, "loadUiType"):
+        ui_type = _uiType(fn)
+        if ui_type is not None:
+            form_class, base_class = ui_type
+            w = base_class()
+            ui = form_class()
+            ui.setupUi(w)
+            for name, value in vars(ui).items():
+                setattr(w, name, value)
+            return w
+
+    return FreeCADGui.PySideUic.loadUi(fn)
+
+
 class widgetMix(QtGui.QDialog):
     """Class to emulate a QDialog where multiple widgets behave as one.
 
@@ -27,6 +65,8 @@ class widgetMix(QtGui.QDialog):
         self.setLayout(self.layout)
         self.widgets = []
         self.extra_attribs = {}
+        # Widget where each attribute was found, filled by __getattr__
+        self._owners = {}
 
     def addWidget(self, w, name=None):
         """Add a widget to the widget mix.
@@ -57,13 +97,24 @@ class widgetMix(QtGui.QDialog):
             self.extra_attribs[name] = w
 
     def __getattr__(self, name):
-        """Get the attributes from the registered widgets."""
+        """Get the attributes from the registered widgets.
+
+        The widget where an attribute is found is remembered, so the dialog
+        code reading the same attribute again does not search all the
+        widgets each time.
+        """
+        w = self._owners.get(name)
+        if w is not None:
+            return getattr(w, name)
+
         # Check first in the widgets regostared with no name
         for w in self.widgets:
             try:
-                return getattr(w, name)
+                value = getattr(w, name)
             except AttributeError:
-                pass
+                continue
+            self._owners[name] = w
+            return value
         try:
             return self.extra_attribs[name]
         except KeyError:
@@ -75,13 +126,13 @@ class WBCommandGUI:
 
         if isinstance(gui, str):
             fn = getUIFilePath(gui)
-            self.form = FreeCADGui.PySideUic.loadUi(fn)
+            self.form = _loadUi(fn)
         elif isinstance(gui, list):
             self.form = widgetMix()
             for w in gui:
                 if isinstance(w, str):
                     fn = getUIFilePath(w)
-                    nw = FreeCADGui.PySideUic.loadUi(fn)
+                    nw = _loadUi(fn)
                     self.form.addWidget(nw)
                 elif isinstance(w, QtGui.QWidget):
                     self.form.addWidget(w)
@@ -32,6 +32,11 @@ class WBPart:
     - Initial version
     """
 
+    # Properties that do not change the shape of the part. Changing them does
+    # not mark the object for recompute, so execute is not called. Child
+    # classes extend this tuple with their own properties.
+    NoRecomputeProperties = ("Enabled", "Reference", "Notes")
+
     def __init__(self, obj, PartType, enabled=True, reference="", notes=""):
         obj.Proxy = self
         obj.addProperty("App::PropertyBool", "Enabled").Enabled = enabled
@@ -60,6 +65,22 @@ class WBPart:
         ).ObjectVersion = 0
         obj.setEditorMode("ObjectVersion", 1)  # 1 Read-Only
 
+        self.setNoRecompute(obj)
+
+    def setNoRecompute(self, obj):
+        """Flag the properties in `NoRecomputeProperties` as NoRecompute.
+
+        Properties not yet added to the object are skipped, so child classes
+        must call this again after adding their own properties.
+        """
+        # setPropertyStatus is only available since FreeCAD 0.19
+        if not hasattr(obj, "setPropertyStatus"):
+            return
+        props = obj.PropertiesList
+        for prop in self.NoRecomputeProperties:
+            if prop in props:
+                obj.setPropertyStatus(prop, "NoRecompute")
+
     def onDocumentRestored(self, obj):
         """
         Handles the migration of objects when a document is restored.
@@ -78,15 +99,22 @@ class WBPart:
         if not hasattr(obj, "BaseVersion"):
             migrate_to_v1(obj)
 
+        self.setNoRecompute(obj)
+
     def onChanged(self, obj, prop):
         """
         Responds to changes in the object's properties.
 
         This method is triggered whenever a property of the object changes.
         Specifically, if the "Enabled" property changes, it adjusts the
-        object's transparency. If this method is overloaded, the overloading
-        method must ensure that the `WBPart.onChanged` method is called to
-        maintain base behavior and functionality.
+        object's transparency. Any other property change is passed to
+        `propertyChanged`, that can be overloaded by the child classes. If
+        this method is overloaded, the overloading method must ensure that
+        the `WBPart.onChanged` method is called to maintain base behavior
+        and functionality.
+
+        Nothing is done while the document is being restored, as the view
+        properties are restored from the file.
 
         Parameters
         ----------
@@ -96,15 +124,31 @@ class WBPart:
         prop : str
             The name of the property that has changed.
         """
+        if "Restore" in obj.State:
+            return
+
         if prop == "Enabled":
             if obj.Enabled:
                 obj.ViewObject.Transparency = 30
             else:
                 obj.ViewObject.Transparency = 90
+            return
+
+        self.propertyChanged(obj, prop)
+
+    def propertyChanged(self, obj, prop):
+        """
+        Responds to changes in the properties of the child classes.
+
+        Called by `onChanged` for every property other than "Enabled". Child
+        classes overload this method instead of `onChanged` to keep the base
+        behavior. By default it does nothing.
+        """
+        pass
 
     def pyoptools_repr(self, obj):
-        print(
-            f"pyOpTools representation of Object {self.pyOpToolsType} not implemented"
+        _wrn(
+            f"pyOpTools representation of Object {obj.ComponentType} not implemented\n"
         )
 
 
@@ -4,6 +4,10 @@
 import FreeCAD
 from freecad.pyoptools.pyOpToolsWB.qthelpers import outputDialog
 
+# Set to True to log what is being wiped in the report view
+_DEBUG = False
+_log = FreeCAD.Console.PrintLog
+
 class WipeMenu:
     """
     Command to wipe (erase propagations and rays) from the system
@@ -27,11 +31,13 @@ class WipeMenu:
             for obj in objs:
                 if hasattr(obj, "ComponentType"):
                     if obj.ComponentType == "Propagation":
-                        print("removing Propagation")
+                        if _DEBUG:
+                            _log("removing Propagation\n")
                         todelete.append(obj.Label)
                         continue
                 if obj.isDerivedFrom("App::DocumentObjectGroup"):
-                    print("InGro")
+                    if _DEBUG:
+                        _log("InGro\n")
                     for iobj in obj.Group:
                         if "Ray" in iobj.Label:  # Hay que hacer esto mejor
                             todelete.append(iobj.Label)
@@ -1,7 +1,6 @@
 import FreeCADGui
 from PySide import QtGui
 from freecad.pyoptools.pyOpToolsWB.qthelpers import getUIFilePath
-import pyoptools.raytrace.mat_lib as matlib
 
 
 class materialWidget(QtGui.QWidget):
@@ -10,17 +9,30 @@ class materialWidget(QtGui.QWidget):
         self.initUI()
 
     def initUI(self):
+        # Imported here, so loading the workbench does not load the glass
+        # catalogs until a dialog with a material widget is opened.
+        from freecad.pyoptools.pyOpToolsWB.pyoptoolshelpers import getGlassCatalogs
+
         fn1 = getUIFilePath("materialWidget.ui")
         self.ui = FreeCADGui.PySideUic.loadUi(fn1, self)
         self.setLayout(self.ui.mainLayout)
 
-        self.ui.Catalog.addItem("Value", [])
+        catalogs = getGlassCatalogs()
+
+        # Fill the combo box in one batch, with signals and repaints disabled
+        catalog = self.ui.Catalog
+        catalog.blockSignals(True)
+        catalog.setUpdatesEnabled(False)
+
+        catalog.addItems(["Value"] + [lib for lib, _ in catalogs])
+        catalog.setItemData(0, [])
+        for n, (_, mats) in enumerate(catalogs, 1):
+            catalog.setItemData(n, list(mats))
 
-        for i in matlib.material.get_glass_libraries():
-            mats=matlib.material.get_glass_materials_from_library(i)
-            self.ui.Catalog.addItem(i, sorted(mats))
+        catalog.setUpdatesEnabled(True)
+        catalog.blockSignals(False)
 
-        self.ui.Catalog.currentIndexChanged.connect(self.catalogChange)
+        catalog.currentIndexChanged.connect(self.catalogChange)
 
     def catalogChange(self, *args):
         if args[0] == 0:
@@ -28,9 +40,13 @@ class materialWidget(QtGui.QWidget):
         else:
             self.ui.Value.setEnabled(False)
 
-        while self.ui.Reference.count():
-            self.ui.Reference.removeItem(0)
-        self.ui.Reference.addItems(self.ui.Catalog.itemData(args[0]))
+        reference = self.ui.Reference
+        reference.blockSignals(True)
+        reference.setUpdatesEnabled(False)
+        reference.clear()
+        reference.addItems(self.ui.Catalog.itemData(args[0]))
+        reference.setUpdatesEnabled(True)
+        reference.blockSignals(False)
 
     # properties defined to make the new code compatible with the old
     @property
@@ -1,9 +1,29 @@
+from functools import lru_cache
+
 import FreeCADGui
-from PySide import QtGui, QtCore
+from PySide import QtGui
 from freecad.pyoptools.pyOpToolsWB.qthelpers import getUIFilePath
-from pivy import coin
 import FreeCAD
-import Part
+
+# Bound once, these are used from the selection and mouse callbacks
+_sel = FreeCADGui.Selection
+_Vector = FreeCAD.Vector
+
+
+# pivy and Part are only needed when a position is being captured, so they
+# are imported on first use instead of when the workbench is loaded.
+@lru_cache(maxsize=None)
+def _coin():
+    from pivy import coin
+
+    return coin
+
+
+@lru_cache(maxsize=None)
+def _part():
+    import Part
+
+    return Part
 
 
 class Gate:
@@ -26,12 +46,8 @@ class Gate:
 
 
 class SelObserver:
-    def __init__(self):
-        view = FreeCADGui.ActiveDocument.ActiveView
-        self.root = view.getSceneGraph()
-
     def addSelection(self, doc, obj, sub, pnt):
-        FreeCADGui.Selection.clearSelection()
+        _sel.clearSelection()
         # print("addSelection")
 
     def removeSelection(self, doc, obj, sub):
@@ -54,17 +70,10 @@ class SelObserver:
 
 def isLine(edge):
     """Some ideas taken from a2plib.py from A2+ workbench"""
-    if not hasattr(edge, "Curve"):
-        return False
-    if isinstance(edge.Curve, Part.Line):
-        return True
-    return False
-
-
-class EventLogger(QtCore.QObject):
-    def eventFilter(self, obj, event):
-        print(event)
-        return QtCore.QObject.eventFilter(self, obj, event)
+    # Edge.Curve builds a new curve object on each access, so read it once
+    # instead of calling hasattr and then reading it again.
+    curve = getattr(edge, "Curve", None)
+    return curve is not None and isinstance(curve, _part().Line)
 
 
 class placementWidget(QtGui.QWidget):
@@ -78,12 +87,25 @@ class placementWidget(QtGui.QWidget):
         self.ui = FreeCADGui.PySideUic.loadUi(fn1, self)
         self.setLayout(self.ui.mainLayout)
 
+        # Plain attributes instead of properties, these are read for every
+        # component inserted.
+        self.Xpos = self.ui.X
+        self.Ypos = self.ui.Y
+        self.Zpos = self.ui.Z
+        self.Xrot = self.ui.RX
+        self.Yrot = self.ui.RY
+        self.Zrot = self.ui.RZ
+
         self.ui.orienCap.toggled.connect(self.getOrientation)
         self.ui.posCap.toggled.connect(self.getPosition)
 
         self.view = FreeCADGui.ActiveDocument.ActiveView
         self.snap_point = None
 
+        # Last (object, component) under the mouse, and its edge if snappable
+        self._last_hit = None
+        self._last_edge = None
+
         view = FreeCADGui.ActiveDocument.ActiveView
         self.root = view.getSceneGraph()
         # view.addEventCallbackPivy( coin.SoLocation2Event.getClassTypeId(), self.mouse_over_cb )
@@ -94,10 +116,11 @@ class placementWidget(QtGui.QWidget):
 
     def registerEvents(self):
         if self.so is None:
+            coin = _coin()
             self.so = SelObserver()
             self.gate = Gate()
-            FreeCADGui.Selection.addSelectionGate(self.gate)
-            FreeCADGui.Selection.addObserver(self.so)
+            _sel.addSelectionGate(self.gate)
+            _sel.addObserver(self.so)
             self.mouse_over = self.view.addEventCallbackPivy(
                 coin.SoLocation2Event.getClassTypeId(), self.mouse_over_cb
             )
@@ -107,8 +130,9 @@ class placementWidget(QtGui.QWidget):
 
     def clearEvents(self):
         if self.so is not None:
-            FreeCADGui.Selection.removeObserver(self.so)
-            FreeCADGui.Selection.removeSelectionGate()
+            coin = _coin()
+            _sel.removeObserver(self.so)
+            _sel.removeSelectionGate()
             self.view.removeEventCallbackPivy(
                 coin.SoLocation2Event.getClassTypeId(), self.mouse_over
             )
@@ -116,6 +140,8 @@ class placementWidget(QtGui.QWidget):
                 coin.SoMouseButtonEvent.getClassTypeId(), self.mouse_click
             )
             self.so = None
+            self._last_hit = None
+            self._last_edge = None
 
         if self.snap_point is not None:
             self.root.removeChild(self.SnapNode)
@@ -132,7 +158,6 @@ class placementWidget(QtGui.QWidget):
     def getPosition(self, checked):
         self.clearEvents()
         if checked:
-            print("add")
             self.ui.orienCap.setChecked(False)
             self.registerEvents()
         else:
@@ -140,6 +165,7 @@ class placementWidget(QtGui.QWidget):
 
     def draw_snap(self, sel, sensor):
         """Method that draw the current snap point"""
+        coin = _coin()
 
         if self.snap_point != sel:
             if self.snap_point is not None:
@@ -162,41 +188,50 @@ class placementWidget(QtGui.QWidget):
     def mouse_over_cb(self, event_callback):
         event = event_callback.getEvent()
         pos = event.getPosition().getValue()
-        listObjects = FreeCADGui.ActiveDocument.ActiveView.getObjectsInfo(
-            (int(pos[0]), int(pos[1]))
-        )
+        listObjects = self.view.getObjectsInfo((int(pos[0]), int(pos[1])))
         if listObjects:
             # Take the closest object to the mouse
             obj = listObjects[0]
-            fcobj = FreeCAD.ActiveDocument.getObject(obj["Object"])
-            fccmp = fcobj.Shape.getElement(obj["Component"])
-            if self.gate.allow(None, fcobj, fccmp) and isLine(fccmp):
-                x = obj["x"]
-                y = obj["y"]
-                z = obj["z"]
-
-                pc = FreeCAD.Vector(x, y, z)
+            hit = (obj["Object"], obj["Component"])
+
+            # While the mouse stays over the same element, reuse the edge
+            # found in the previous event instead of looking it up again.
+            if hit != self._last_hit:
+                fcobj = FreeCAD.ActiveDocument.getObject(obj["Object"])
+                fccmp = fcobj.Shape.getElement(obj["Component"])
+                if self.gate.allow(None, fcobj, fccmp) and isLine(fccmp):
+                    self._last_edge = fccmp
+                else:
+                    self._last_edge = None
+                self._last_hit = hit
+
+            fccmp = self._last_edge
+            if fccmp is not None:
+                pc = _Vector(obj["x"], obj["y"], obj["z"])
                 p0 = fccmp.Vertexes[0].Point
                 p1 = fccmp.Vertexes[1].Point
 
                 # Capture the snap componrent to be used later
                 self.snap_obj = fccmp
 
-                if ((pc - p0).Length) < ((pc - p1).Length):
-                    # because of coin3d limitations, an scene can not be modified
-                    # inside an event handler. So a Sensor must be used, to
-                    # queue the  draw_snap method for later.
-                    # The "self", can not be removed because the sensor is garbage
-                    # collected as soon as mouse_over_cb is finished, and the
-                    # method draw_snap is never called.
-
-                    self.ts = coin.SoOneShotSensor(self.draw_snap, p0)
-                    self.ts.schedule()
-                else:
-                    self.ts = coin.SoOneShotSensor(self.draw_snap, p1)
-                    self.ts.schedule()
+                # Compare squared distances, there is no need for the sqrt
+                d0 = pc - p0
+                d1 = pc - p1
+                snap = p0 if d0.dot(d0) < d1.dot(d1) else p1
             else:
-                self.ts = coin.SoOneShotSensor(self.draw_snap, None)
+                snap = None
+
+            # Only touch the scene graph when the snap point changes, not on
+            # every mouse move.
+            if snap != self.snap_point:
+                # because of coin3d limitations, an scene can not be modified
+                # inside an event handler. So a Sensor must be used, to
+                # queue the  draw_snap method for later.
+                # The "self", can not be removed because the sensor is garbage
+                # collected as soon as mouse_over_cb is finished, and the
+                # method draw_snap is never called.
+
+                self.ts = _coin().SoOneShotSensor(self.draw_snap, snap)
                 self.ts.schedule()
 
     def mouse_click_cb(self, event_callback):
@@ -208,27 +243,3 @@ class placementWidget(QtGui.QWidget):
 
             if self.ui.orienCap.isChecked:
                 pass
-
-    @property
-    def Xpos(self):
-        return self.ui.X
-
-    @property
-    def Ypos(self):
-        return self.ui.Y
-
-    @property
-    def Zpos(self):
-        return self.ui.Z
-
-    @property
-    def Xrot(self):
-        return self.ui.RX
-
-    @property
-    def Yrot(self):
-        return self.ui.RY
-
-    @property
-    def Zrot(self):
-        return self.ui.RZ
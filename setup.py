@@ -1,13 +1,17 @@
 from setuptools import setup
 import os
+import re
 # from freecad.workbench_starterkit.version import __version__
 # name: this is the name of the distribution.
 # Packages using the same name here cannot be installed together
 
 version_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), 
                             "version.py")
+# Read the version string without executing version.py
 with open(version_path) as fp:
-    exec(fp.read())
+    __version__ = re.search(
+        r"^__version__\s*=\s*['\"]([^'\"]+)['\"]", fp.read(), re.M
+    ).group(1)
 
 setup(name='freecad.pyoptools',
       version=str(__version__),